@@ -1,128 +1,194 @@
 import os
-from docx import Document
-from docx.document import Document as _Document
-from docx.oxml.table import CT_Tbl
-from docx.oxml.text.paragraph import CT_P
-from docx.table import _Cell, Table
-from docx.text.paragraph import Paragraph
+import re
+import shutil
+import zipfile
 import argparse
+import posixpath
+import concurrent.futures
+from lxml import etree
 from omml_to_latex import convert_omml_to_latex
 
 
-def save_image(rel, image_dir, image_id):
-    """Save image from relationship and return the filename."""
+# Namespace prefixes used in document.xml.  Tags are compared against these
+# fully-qualified constants instead of `endswith('}t')`-style suffix checks.
+W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+M_NS = '{http://schemas.openxmlformats.org/officeDocument/2006/math}'
+A_NS = '{http://schemas.openxmlformats.org/drawingml/2006/main}'
+R_NS = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+
+W_BODY = W_NS + 'body'
+W_P = W_NS + 'p'
+W_TBL = W_NS + 'tbl'
+W_TR = W_NS + 'tr'
+W_TC = W_NS + 'tc'
+W_R = W_NS + 'r'
+W_T = W_NS + 't'
+W_PPR = W_NS + 'pPr'
+W_PSTYLE = W_NS + 'pStyle'
+W_VAL = W_NS + 'val'
+W_DRAWING = W_NS + 'drawing'
+W_TXBX_CONTENT = W_NS + 'txbxContent'
+W_STYLE = W_NS + 'style'
+W_STYLEID = W_NS + 'styleId'
+W_NAME = W_NS + 'name'
+M_OMATH = M_NS + 'oMath'
+A_BLIP = A_NS + 'blip'
+R_EMBED = R_NS + 'embed'
+
+MC_NS = '{http://schemas.openxmlformats.org/markup-compatibility/2006}'
+MC_CHOICE = MC_NS + 'Choice'
+
+PKG_RELATIONSHIP = '{http://schemas.openxmlformats.org/package/2006/relationships}Relationship'
+
+
+def build_image_relationship_map(docx_zip):
+    """Map relationship ids from word/_rels/document.xml.rels to zip part names."""
     try:
-        image_bytes = rel.target_part.blob
-        image_ext = os.path.splitext(rel.target_ref)[-1]
+        rels_xml = docx_zip.read('word/_rels/document.xml.rels')
+    except KeyError:
+        return {}
+
+    relationship_map = {}
+    for rel in etree.fromstring(rels_xml).iter(PKG_RELATIONSHIP):
+        target = rel.get('Target')
+        if not target or rel.get('TargetMode') == 'External':
+            continue
+        # Targets are relative to word/, e.g. "media/image1.png"
+        relationship_map[rel.get('Id')] = posixpath.normpath(posixpath.join('word', target))
+    return relationship_map
+
+
+def build_style_name_map(docx_zip):
+    """Map style ids from word/styles.xml to their display names."""
+    # Style ids are locale-independent ("Heading1") but some producers use
+    # localized or custom ids; the style name resolves those cases
+    try:
+        styles_xml = docx_zip.read('word/styles.xml')
+    except KeyError:
+        return {}
+
+    style_name_map = {}
+    for style in etree.fromstring(styles_xml).iter(W_STYLE):
+        style_id = style.get(W_STYLEID)
+        name_el = style.find(W_NAME)
+        if style_id and name_el is not None:
+            style_name_map[style_id] = name_el.get(W_VAL) or ""
+    return style_name_map
+
+
+def save_image(docx_zip, part_name, image_dir, image_id):
+    """Stream an image part out of the docx zip and return the filename."""
+    try:
+        image_ext = os.path.splitext(part_name)[-1]
         if not image_ext:
             image_ext = '.png'  # Default extension if none found
-            
+
         image_filename = f"image_{image_id}{image_ext}"
         image_path = os.path.join(image_dir, image_filename)
-        
-        with open(image_path, 'wb') as f:
-            f.write(image_bytes)
-            
+
+        # Stream from the already-open zip instead of materializing the whole
+        # blob through python-docx's part layer
+        with docx_zip.open(part_name) as src, open(image_path, 'wb') as dst:
+            shutil.copyfileobj(src, dst, length=1 << 20)
+
         return image_filename
     except Exception as e:
         print(f"Error extracting image: {e}")
         return None
 
 
-def iter_block_items(parent):
-    """Generator to iterate through all block items (paragraphs and tables) in order."""
-    if isinstance(parent, _Document):
-        parent_elm = parent.element.body
-    elif isinstance(parent, _Cell):
-        parent_elm = parent._tc
-    else:
-        raise ValueError("Expected a Document or a Cell")
-        
-    for child in parent_elm.iterchildren():
-        if isinstance(child, CT_P):
-            yield Paragraph(child, parent)
-        elif isinstance(child, CT_Tbl):
-            yield Table(child, parent)
-
-
-def get_element_text(element):
-    """Extract text from an XML element."""
-    text = ""
-    for child in element.iter():
-        if child.tag.endswith('}t'):  # Text element in Word XML
-            if child.text:
-                text += child.text
-    return text
-
-
 def table_to_markdown(table):
-    """Convert a docx table to Markdown format."""
-    if not table.rows:
+    """Convert a raw <w:tbl> element to Markdown format."""
+    # Single pass over the table: collect stripped cell strings row-major and
+    # grow the column widths incrementally, so each cell's XML is walked once
+    rows = []
+    col_widths = []
+    for row in table.iterchildren(W_TR):
+        row_cells = []
+        for cell in row.iterchildren(W_TC):
+            cell_text = ''.join(cell.itertext(W_T)).strip() or " "
+            i = len(row_cells)
+            if i < len(col_widths):
+                col_widths[i] = max(col_widths[i], len(cell_text))
+            else:
+                col_widths.append(max(len(cell_text), 3))
+            row_cells.append(cell_text)
+        rows.append(row_cells)
+
+    if not rows:
         return ""
-        
+
     md_table = []
-    
-    # Extract header row
-    header = []
-    for cell in table.rows[0].cells:
-        header.append(cell.text.strip() or " ")
-    
-    # Calculate column widths
-    col_widths = [max(len(header[i]), 3) for i in range(len(header))]
-    
-    # Adjust column widths based on content
-    for row in table.rows[1:]:
-        for i, cell in enumerate(row.cells):
-            if i < len(col_widths):
-                col_widths[i] = max(col_widths[i], len(cell.text.strip() or " "))
-    
+
     # Create header row
+    header = rows[0]
     header_formatted = "| " + " | ".join(h.ljust(col_widths[i]) for i, h in enumerate(header)) + " |"
     md_table.append(header_formatted)
-    
+
     # Create separator row
-    separator = "|" + "|".join("-" * (w + 2) for w in col_widths) + "|"
+    separator = "|" + "|".join("-" * (w + 2) for w in col_widths[:len(header)]) + "|"
     md_table.append(separator)
-    
+
     # Create content rows
-    for row in table.rows[1:]:
-        row_cells = []
-        for i, cell in enumerate(row.cells):
-            if i < len(col_widths):
-                row_cells.append((cell.text.strip() or " ").ljust(col_widths[i]))
-        md_table.append("| " + " | ".join(row_cells) + " |")
-    
+    for row_cells in rows[1:]:
+        line = "| " + " | ".join(
+            cell.ljust(col_widths[i]) for i, cell in enumerate(row_cells[:len(header)])
+        ) + " |"
+        md_table.append(line)
+
     return "\n".join(md_table)
 
 
-def find_embedded_image_ids(element):
-    """Find embedded image IDs in an element."""
-    image_ids = []
-    
-    # We need to look for drawing elements in the XML
-    for child in element.iter():
-        if child.tag.endswith('}drawing'):
-            # Look for blip elements that contain image references
-            for subchild in child.iter():
-                if subchild.tag.endswith('}blip'):
-                    # Get the embed attribute which is the relationship ID
-                    for key, value in subchild.attrib.items():
-                        if key.endswith('}embed'):
-                            image_ids.append(value)
-    
-    return image_ids
-
-
-def extract_math_from_element(element):
-    """Extract math elements (OMML) from a paragraph element."""
-    math_elements = []
-    
-    # Look for math elements in the XML
-    for child in element.iter():
-        if child.tag.endswith('}oMath'):
-            math_elements.append(child)
-    
-    return math_elements
+def emit_drawing_images(drawing, result_parts, docx_zip, image_dir, image_id_counter, relationship_map):
+    """Save the images referenced by a <w:drawing> and append their markdown tokens."""
+    # iterdescendants filters to blip elements at the C level
+    for blip in drawing.iterdescendants(A_BLIP):
+        embed_id = blip.get(R_EMBED)
+        if not embed_id or embed_id not in relationship_map:
+            continue
+        part_name = relationship_map[embed_id]
+        image_filename = save_image(docx_zip, part_name, image_dir, image_id_counter[0])
+        if image_filename:
+            # image_dir is already absolute with forward slashes, so the
+            # markdown link is a cheap f-string instead of an abspath call
+            # (and its getcwd syscall) per image
+            result_parts.append(f" ![image_{image_id_counter[0]}]({image_dir}/{image_filename}) ")
+            image_id_counter[0] += 1
+
+
+def emit_drawing_text_boxes(drawing, result_parts, docx_zip, image_dir, image_id_counter,
+                            relationship_map):
+    """Walk the text boxes inside a <w:drawing> and append their content."""
+    # Word wraps text-box drawings in mc:AlternateContent; the walker already
+    # recurses into the mc:Fallback copy (w:pict/w:txbxContent), so skip the
+    # mc:Choice drawing to avoid emitting the same text twice. Bare drawings
+    # from other producers have no fallback and are walked here.
+    parent = drawing.getparent()
+    if parent is not None and parent.tag == MC_CHOICE:
+        return
+    for txbx in drawing.iterdescendants(W_TXBX_CONTENT):
+        box_text = process_paragraph_element_recursively(
+            txbx, docx_zip, image_dir, image_id_counter, relationship_map)
+        if box_text:
+            result_parts.append(box_text)
+
+
+# Path to the style id inside a paragraph, resolved in one find() call
+_PSTYLE_PATH = W_PPR + '/' + W_PSTYLE
+
+# Trailing level digits of a heading style id like "Heading3"
+_HEADING_LEVEL_RE = re.compile(r'(\d+)$')
+
+# Runs of whitespace collapsed to a single space during paragraph cleanup
+_WS_RE = re.compile(r'\s+')
+
+
+def get_paragraph_style(element):
+    """Read the paragraph style id from <w:pPr><w:pStyle w:val="..."/>."""
+    pstyle = element.find(_PSTYLE_PATH)
+    if pstyle is not None:
+        return pstyle.get(W_VAL) or ""
+    return ""
 
 
 def omml_to_latex_basic(omml_element):
@@ -130,81 +196,81 @@ def omml_to_latex_basic(omml_element):
     return convert_omml_to_latex(omml_element)
 
 
-def process_paragraph_with_math(paragraph, image_dir, image_id_counter, relationship_map):
-    """Process a paragraph that may contain text, images, and math formulas."""
-    # Check for heading style first
-    if paragraph.style.name.startswith('Heading'):
-        heading_level = int(paragraph.style.name[-1]) if paragraph.style.name[-1].isdigit() else 1
-        para_text = paragraph.text.strip()
-        if para_text:
-            return ['#' * heading_level + ' ' + para_text]
-
-    # Process the paragraph element directly to maintain order
-    result_text = process_paragraph_element_recursively(paragraph._element)
-
-    # Handle images in the paragraph
-    image_content = []
-    for image_id in find_embedded_image_ids(paragraph._element):
-        if image_id in relationship_map:
-            rel = relationship_map[image_id]
-            image_filename = save_image(rel, image_dir, image_id_counter[0])
-            if image_filename:
-                # Use absolute path for the image
-                image_path = os.path.abspath(os.path.join(image_dir, image_filename))
-                # Convert backslashes to forward slashes for markdown compatibility
-                image_path = image_path.replace('\\', '/')
-                image_content.append(f"![image_{image_id_counter[0]}]({image_path})")
-                image_id_counter[0] += 1
+def process_paragraph(element, docx_zip, image_dir, image_id_counter, relationship_map,
+                      style_name_map):
+    """Process a <w:p> element that may contain text, images, and math formulas."""
+    # Check for heading style first, either by the style id itself or by the
+    # display name it resolves to in styles.xml
+    style = get_paragraph_style(element)
+    if style:
+        style_name = style_name_map.get(style, "")
+        if style.startswith('Heading') or style_name.lower().startswith('heading'):
+            match = _HEADING_LEVEL_RE.search(style) or _HEADING_LEVEL_RE.search(style_name)
+            heading_level = int(match.group(1)) if match else 1
+            # Tag-filtered itertext concatenates the <w:t> runs in a single
+            # C-level pass
+            para_text = ''.join(element.itertext(W_T)).strip()
+            if para_text:
+                return ['#' * heading_level + ' ' + para_text]
+
+    # Process the paragraph element directly to maintain order; images are
+    # emitted inline by the walker so they keep their position in the text
+    result_text = process_paragraph_element_recursively(
+        element, docx_zip, image_dir, image_id_counter, relationship_map)
 
     result = []
-    if result_text and result_text.strip():
-        # Clean up extra spaces
-        result_text = ' '.join(result_text.split())
-        result.append(result_text)
-    result.extend(image_content)
+    if result_text and not result_text.isspace():
+        # Clean up extra spaces in one pass instead of split + join, which
+        # materializes a token list per paragraph
+        result.append(_WS_RE.sub(' ', result_text).strip())
 
     return result
 
 
+def process_table(element, docx_zip, image_dir, image_id_counter, relationship_map,
+                  style_name_map):
+    """Process a <w:tbl> element into a list of markdown blocks."""
+    md_table = table_to_markdown(element)
+    return [md_table] if md_table else []
+
+
 def print_xml_structure(element, level=0):
     """Print the XML structure of an element for debugging."""
     indent = "  " * level
-    tag = element.tag.split('}')[-1] if '}' in element.tag else element.tag
+    tag = element.tag[element.tag.rfind('}') + 1:]
     attrs = []
     for key, value in element.attrib.items():
-        key = key.split('}')[-1] if '}' in key else key
+        key = key[key.rfind('}') + 1:]
         attrs.append(f"{key}='{value}'")
     attrs_str = " ".join(attrs)
-    
+
     if element.text and element.text.strip():
         print(f"{indent}<{tag} {attrs_str}>{element.text.strip()}")
     else:
         print(f"{indent}<{tag} {attrs_str}>")
-    
+
     for child in element:
         print_xml_structure(child, level + 1)
-    
+
     if element.tail and element.tail.strip():
         print(f"{indent}{element.tail.strip()}")
 
 
-def process_paragraph_element_recursively(element):
-    """Recursively process paragraph element to extract text and math in correct order."""
+def process_paragraph_element_recursively(element, docx_zip, image_dir, image_id_counter, relationship_map):
+    """Recursively process paragraph element to extract text, images, and math in correct order."""
     result_parts = []
 
     # Process all child elements in order
     for child in element:
-        tag = child.tag.split('}')[-1] if '}' in child.tag else child.tag
+        tag = child.tag
 
-        if tag == 'r':  # Run element
+        if tag == W_R:  # Run element
             # Process run content
-            run_text = process_run_element(child)
+            run_text = process_run_element(child, docx_zip, image_dir, image_id_counter, relationship_map)
             if run_text:
                 result_parts.append(run_text)
 
-        elif tag == 'oMath':  # Math element
-            # (debug prints removed)
-            
+        elif tag == M_OMATH:  # Math element
             latex_formula = omml_to_latex_basic(child)
             if latex_formula and latex_formula != "[Math Formula]":
                 # Determine if it's inline or display math
@@ -213,93 +279,115 @@ def process_paragraph_element_recursively(element):
                 else:
                     result_parts.append(f" ${latex_formula}$ ")
 
+        elif tag == W_DRAWING:  # Embedded image and/or text box
+            emit_drawing_images(child, result_parts, docx_zip, image_dir, image_id_counter, relationship_map)
+            emit_drawing_text_boxes(child, result_parts, docx_zip, image_dir, image_id_counter, relationship_map)
+
         else:
             # Recursively process other elements
-            child_text = process_paragraph_element_recursively(child)
+            child_text = process_paragraph_element_recursively(
+                child, docx_zip, image_dir, image_id_counter, relationship_map)
             if child_text:
                 result_parts.append(child_text)
 
     return ''.join(result_parts)
 
 
-def process_run_element(run_element):
-    """Process a run element to extract text and inline math."""
+def process_run_element(run_element, docx_zip, image_dir, image_id_counter, relationship_map):
+    """Process a run element to extract text, images, and inline math."""
     result_parts = []
 
     for child in run_element:
-        tag = child.tag.split('}')[-1] if '}' in child.tag else child.tag
+        tag = child.tag
 
-        if tag == 't':  # Text element
+        if tag == W_T:  # Text element
             if child.text:
                 result_parts.append(child.text)
 
-        elif tag == 'oMath':  # Inline math in run
+        elif tag == M_OMATH:  # Inline math in run
             latex_formula = omml_to_latex_basic(child)
             if latex_formula and latex_formula != "[Math Formula]":
                 # For math in runs, prefer inline format
                 result_parts.append(f" ${latex_formula}$ ")
 
+        elif tag == W_DRAWING:  # Embedded image and/or text box
+            emit_drawing_images(child, result_parts, docx_zip, image_dir, image_id_counter, relationship_map)
+            emit_drawing_text_boxes(child, result_parts, docx_zip, image_dir, image_id_counter, relationship_map)
+
         else:
             # Recursively process other elements
-            child_text = process_run_element(child)
+            child_text = process_run_element(child, docx_zip, image_dir, image_id_counter, relationship_map)
             if child_text:
                 result_parts.append(child_text)
 
     return ''.join(result_parts)
 
 
+# Dispatch table for top-level body blocks fed by the iterparse pass
+_BLOCK_HANDLERS = {
+    W_P: process_paragraph,
+    W_TBL: process_table,
+}
+
+
 def docx_to_markdown_with_formulas(docx_path, output_md_path, image_dir="images"):
     """Convert DOCX file to Markdown, preserving text, images, tables, and math formulas in order."""
     # Create image directory if it doesn't exist
     if not os.path.exists(image_dir):
         os.makedirs(image_dir)
-    
-    doc = Document(docx_path)
-    md_content = []
-    
+
+    # Resolve the image directory once; markdown links use absolute paths
+    # with forward slashes regardless of platform
+    image_dir = os.path.abspath(image_dir).replace(os.sep, '/')
+
     # Use a counter wrapped in a list to track the image_id through function calls
     image_id_counter = [1]
     formula_count = {'inline': 0, 'display': 0}
-    
-    # Build a map of relationship IDs to relationships
-    relationship_map = {}
-    for rel_id, rel in doc.part.rels.items():
-        relationship_map[rel_id] = rel
-    
-    # Process document blocks (paragraphs and tables) in order
-    for block in iter_block_items(doc):
-        if isinstance(block, Paragraph):
-            para_content = process_paragraph_with_math(block, image_dir, image_id_counter, relationship_map)
-            
-            # Count formulas for statistics
-            for content in para_content:
+
+    # Stream document.xml in a single iterparse pass instead of materializing
+    # python-docx wrappers for every block, and write each markdown block to
+    # the output file as soon as it is produced.  Only top-level paragraphs
+    # and tables are dispatched; paragraphs nested in table cells are handled
+    # as part of their table.  errors='xmlcharrefreplace' covers characters
+    # the target encoding cannot represent, so no fallback pass is needed.
+    with open(output_md_path, 'w', encoding='utf-8', buffering=1 << 20,
+              errors='xmlcharrefreplace') as out, \
+            zipfile.ZipFile(docx_path) as docx_zip, \
+            docx_zip.open('word/document.xml') as source:
+        # Relationship ids resolve to zip part names; images are streamed
+        # from the same open zip handle as they are encountered
+        relationship_map = build_image_relationship_map(docx_zip)
+        style_name_map = build_style_name_map(docx_zip)
+
+        needs_sep = False
+        for _event, element in etree.iterparse(source, events=('end',), tag=(W_P, W_TBL)):
+            parent = element.getparent()
+            if parent is None or parent.tag != W_BODY:
+                continue
+
+            handler = _BLOCK_HANDLERS[element.tag]
+            block_content = handler(element, docx_zip, image_dir, image_id_counter,
+                                    relationship_map, style_name_map)
+
+            for content in block_content:
+                # Count formulas for statistics
                 if content.startswith('$$') and content.endswith('$$'):
                     formula_count['display'] += 1
                 elif '$' in content and not content.startswith('$$'):
                     formula_count['inline'] += content.count('$') // 2
-            
-            if para_content:
-                md_content.extend(para_content)
-                
-        elif isinstance(block, Table):
-            md_table = table_to_markdown(block)
-            if md_table:
-                md_content.append(md_table)
-    
-    # Note: All images should be processed within paragraphs above
-    # No need to check for remaining images as they are handled in paragraph processing
-    
-    # Write to markdown file - ensure UTF-8 encoding
-    try:
-        with open(output_md_path, 'w', encoding='utf-8') as f:
-            f.write('\n\n'.join(md_content))
-        print(f"Markdown file saved to: {output_md_path}")
-    except UnicodeEncodeError:
-        # Fallback to write with explicit error handling
-        with open(output_md_path, 'w', encoding='utf-8', errors='xmlcharrefreplace') as f:
-            f.write('\n\n'.join(md_content))
-        print(f"Markdown file saved to: {output_md_path} (with character encoding workaround)")
-    
+
+                if needs_sep:
+                    out.write('\n\n')
+                out.write(content)
+                needs_sep = True
+
+            # Free the processed subtree and its preceding siblings to keep
+            # memory flat while streaming
+            element.clear()
+            while element.getprevious() is not None:
+                del parent[0]
+
+    print(f"Markdown file saved to: {output_md_path}")
     print(f"Images saved to: {image_dir}/")
     print(f"Total images found: {image_id_counter[0] - 1}")
     print(f"Formula conversion completed.")
@@ -308,25 +396,54 @@ def docx_to_markdown_with_formulas(docx_path, output_md_path, image_dir="images"
     print(f"  - Display formulas: {formula_count['display']}")
     print(f"  - Total formulas: {formula_count['inline'] + formula_count['display']}")
 
-    # # Save a debug copy with BOM for troubleshooting encoding issues
-    # with open(output_md_path + '.debug', 'w', encoding='utf-8-sig') as f:
-    #     f.write('\n\n'.join(md_content))
-    # print(f"Debug copy with BOM saved to: {output_md_path}.debug")
+
+def convert_many(docx_paths, image_dir="images", workers=None):
+    """Convert several DOCX files in parallel, one worker process per file.
+
+    Each file is independent and the conversion is CPU-bound on Python tree
+    walking, so process-level parallelism scales with core count. Outputs use
+    the default <name>_with_formulas.md naming; each file gets its own image
+    subdirectory under image_dir to avoid collisions.
+    """
+    if workers is None:
+        workers = os.cpu_count()
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {}
+        for docx_path in docx_paths:
+            output_path = os.path.splitext(docx_path)[0] + '_with_formulas.md'
+            per_file_image_dir = os.path.join(
+                image_dir, os.path.splitext(os.path.basename(docx_path))[0])
+            future = executor.submit(
+                docx_to_markdown_with_formulas, docx_path, output_path, per_file_image_dir)
+            futures[future] = docx_path
+
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                print(f"Error converting {futures[future]}: {e}")
 
 
 def main():
     parser = argparse.ArgumentParser(description='Convert DOCX file to Markdown with math formula support')
-    parser.add_argument('docx_file', help='Input DOCX file path')
-    parser.add_argument('-o', '--output', help='Output Markdown file path')
+    parser.add_argument('docx_files', nargs='+', help='Input DOCX file path(s)')
+    parser.add_argument('-o', '--output', help='Output Markdown file path (single input only)')
     parser.add_argument('-i', '--image_dir', default='images', help='Directory to save images')
-    
+    parser.add_argument('-w', '--workers', type=int, default=None,
+                        help='Worker processes for batch conversion (default: CPU count)')
+
     args = parser.parse_args()
-    
-    docx_path = args.docx_file
-    output_path = args.output if args.output else os.path.splitext(docx_path)[0] + '_with_formulas.md'
-    
-    docx_to_markdown_with_formulas(docx_path, output_path, args.image_dir)
+
+    if len(args.docx_files) == 1:
+        docx_path = args.docx_files[0]
+        output_path = args.output if args.output else os.path.splitext(docx_path)[0] + '_with_formulas.md'
+        docx_to_markdown_with_formulas(docx_path, output_path, args.image_dir)
+    else:
+        if args.output:
+            parser.error('-o/--output only applies to a single input file')
+        convert_many(args.docx_files, args.image_dir, args.workers)
 
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
@@ -1,65 +1,205 @@
 """
 OMML (Office Math Markup Language) to LaTeX converter
 This module provides functions to convert Microsoft Word math equations to LaTeX format.
+
+The converter operates on lxml Elements (as produced by the document.xml
+streaming pass); stdlib ElementTree nodes are not supported.
 """
 
+import functools
+import logging
 import re
-import xml.etree.ElementTree as ET
 from lxml import etree
 
 
+logger = logging.getLogger(__name__)
+
+
+# Namespace-qualified tags for the fixed-structure OMML children, so lxml's
+# C-level find() can fetch them directly instead of a Python loop per child
+M_NS = '{http://schemas.openxmlformats.org/officeDocument/2006/math}'
+M_NUM = M_NS + 'num'
+M_DEN = M_NS + 'den'
+M_E = M_NS + 'e'
+M_SUB = M_NS + 'sub'
+M_SUP = M_NS + 'sup'
+M_DEG = M_NS + 'deg'
+M_LIM = M_NS + 'lim'
+M_FNAME = M_NS + 'fName'
+M_NARYPR = M_NS + 'naryPr'
+M_CHR = M_NS + 'chr'
+M_DPR = M_NS + 'dPr'
+M_MR = M_NS + 'mr'
+
+
+@functools.lru_cache(maxsize=256)
+def _localname(tag):
+    """Extract the tag local name; rfind slicing avoids split('}') list churn.
+
+    The distinct tags in a document form a small fixed set and lxml hands out
+    the same interned strings, so the cache turns repeat strips into a dict
+    hit on an already-hashed key.
+    """
+    return tag[tag.rfind('}') + 1:]
+
+
+# Strips equation numbering and stray hashes in one scan: a numbered group
+# like #(2-1) or #\left( 2-1 \right), or a lone # that is neither escaped
+# nor the start of a command. The alternatives are disjoint at any given
+# '#' (the following character differs), so one alternation pass gives the
+# same result as running them as separate substitutions.
+_HASH_STRIP_RE = re.compile(
+    r'#\\left\([^)]+\\right\)'  # #\left( 2-1 \right)
+    r'|#\([^)]+\)'              # #(2-1)
+    r'|(?<!\\)#(?![a-zA-Z])'    # standalone #
+)
+
+# Post-processing patterns for clean_latex_output
+_DOUBLE_BACKSLASH_RE = re.compile(r'\\\\(?!\\|$)')
+_TRAILING_COMMA_RE = re.compile(r'\s*,\s*$')
+_WS_RE = re.compile(r'\s+')
+
+# Stray backslash runs ahead of operator names in convert_limit_lower
+_BACKSLASH_RUN_RE = re.compile(r'\\+')
+
+# LaTeX commands that should have a space inserted when immediately followed
+# by an alphanumeric character.
+# Note: The short command \\in is deliberately excluded to avoid interfering
+# with longer commands like \\infty or \\int. If needed, callers should
+# insert explicit spaces around \\in themselves.
+_LATEX_COMMANDS = [
+    r'\\rightarrow', r'\\leftarrow', r'\\leftrightarrow', r'\\Rightarrow',
+    r'\\Leftarrow', r'\\Leftrightarrow', r'\\uparrow', r'\\downarrow', r'\\updownarrow',
+    r'\\subseteq', r'\\supseteq', r'\\subset', r'\\supset',
+    r'\\notin', r'\\neq', r'\\approx', r'\\equiv', r'\\propto',
+    r'\\parallel', r'\\emptyset', r'\\forall', r'\\exists',
+    r'\\geq', r'\\leq', r'\\pm', r'\\mp', r'\\times', r'\\div',
+    r'\\cdot', r'\\circ', r'\\sqrt', r'\\angle', r'\\perp',
+    r'\\infty', r'\\partial', r'\\nabla',
+    # Greek letters and variants
+    r'\\Gamma', r'\\Delta', r'\\Theta', r'\\Lambda', r'\\Xi', r'\\Pi',
+    r'\\Sigma', r'\\Upsilon', r'\\Phi', r'\\Psi', r'\\Omega',
+    r'\\alpha', r'\\beta', r'\\gamma', r'\\delta', r'\\epsilon', r'\\zeta',
+    r'\\eta', r'\\theta', r'\\iota', r'\\kappa', r'\\lambda', r'\\mu',
+    r'\\nu', r'\\xi', r'\\pi', r'\\rho', r'\\sigma', r'\\tau',
+    r'\\upsilon', r'\\phi', r'\\chi', r'\\psi', r'\\omega',
+    r'\\cup', r'\\cap', r'\\sim'
+]
+
+# One alternation handles every command in a single scan; longest-first
+# ordering keeps prefixes (e.g. \\subset vs \\subseteq) from winning early
+_LATEX_CMD_RE = re.compile(
+    '(' + '|'.join(sorted(_LATEX_COMMANDS, key=len, reverse=True)) + r')(?=[a-zA-Z0-9])'
+)
+
+# Membership operator followed by an uppercase identifier, e.g. "\inD".
+# Lowercase continuations are left alone so \\infty / \\int stay intact.
+_IN_UPPER_RE = re.compile(r'\\in([A-Z])')
+
+# Map common n-ary operators to their LaTeX commands
+_NARY_OP_MAP = {
+    '∑': '\\sum',
+    '∫': '\\int',
+    '∏': '\\prod',
+    '⋃': '\\bigcup',
+    '⋂': '\\bigcap',
+    '⋁': '\\bigvee',
+    '⋀': '\\bigwedge',
+    'max': '\\operatorname*{max}',
+    'min': '\\operatorname*{min}',
+}
+
+
 class OmmlToLatexConverter:
     """Converter class for OMML to LaTeX transformation."""
-    
+
+    # Built once at class creation and shared by every instance
+    symbol_map = {
+        # Greek letters
+        'α': '\\alpha', 'β': '\\beta', 'γ': '\\gamma', 'δ': '\\delta',
+        'ε': '\\epsilon', 'ζ': '\\zeta', 'η': '\\eta', 'θ': '\\theta',
+        'ι': '\\iota', 'κ': '\\kappa', 'λ': '\\lambda', 'μ': '\\mu',
+        'ν': '\\nu', 'ξ': '\\xi', 'ο': 'o', 'π': '\\pi',
+        'ρ': '\\rho', 'σ': '\\sigma', 'τ': '\\tau', 'υ': '\\upsilon',
+        'φ': '\\phi', 'χ': '\\chi', 'ψ': '\\psi', 'ω': '\\omega',
+        
+        # Capital Greek letters
+        'Α': 'A', 'Β': 'B', 'Γ': '\\Gamma', 'Δ': '\\Delta',
+        'Ε': 'E', 'Ζ': 'Z', 'Η': 'H', 'Θ': '\\Theta',
+        'Ι': 'I', 'Κ': 'K', 'Λ': '\\Lambda', 'Μ': 'M',
+        'Ν': 'N', 'Ξ': '\\Xi', 'Ο': 'O', 'Π': '\\Pi',
+        'Ρ': 'P', 'Σ': '\\Sigma', 'Τ': 'T', 'Υ': '\\Upsilon',
+        'Φ': '\\Phi', 'Χ': 'X', 'Ψ': '\\Psi', 'Ω': '\\Omega',
+        
+        # Mathematical operators
+        '∞': '\\infty', '∑': '\\sum', '∫': '\\int', '∂': '\\partial',
+        '∇': '\\nabla', '∆': '\\Delta', '∏': '\\prod',
+        
+        # Relations
+        '≤': '\\leq', '≥': '\\geq', '≠': '\\neq', '≈': '\\approx',
+        '≡': '\\equiv', '∝': '\\propto', '∼': '\\sim',
+        
+        # Set theory
+        '∈': '\\in', '∉': '\\notin', '⊂': '\\subset', '⊆': '\\subseteq',
+        '⊃': '\\supset', '⊇': '\\supseteq', '∪': '\\cup', '∩': '\\cap',
+        '∅': '\\emptyset', '∀': '\\forall', '∃': '\\exists',
+        
+        # Arrows
+        '→': '\\rightarrow', '←': '\\leftarrow', '↔': '\\leftrightarrow',
+        '⇒': '\\Rightarrow', '⇐': '\\Leftarrow', '⇔': '\\Leftrightarrow',
+        '↑': '\\uparrow', '↓': '\\downarrow', '↕': '\\updownarrow',
+        
+        # Other symbols
+        '±': '\\pm', '∓': '\\mp', '×': '\\times', '÷': '\\div',
+        '·': '\\cdot', '∘': '\\circ', '√': '\\sqrt', '∝': '\\propto',
+        '∠': '\\angle', '⊥': '\\perp', '∥': '\\parallel',
+        '~': '\\sim',  # ASCII tilde mapped to \sim (within math)
+        # Additional mappings for calligraphic/blackboard symbols and variants used in formulas
+        'ℒ': '\\mathcal{L}',  # Script L
+        '𝒟': '\\mathcal{D}',  # Script D (uppercase)
+        'ℰ': '\\mathbb{E}',  # Blackboard bold E (alternative)
+        '𝔼': '\\mathbb{E}',  # Blackboard bold E (common)
+        'ϕ': '\\varphi',      # Variant phi
+        # Unicode minus/dashes normalized to the ASCII hyphen-minus that
+        # LaTeX math mode expects
+        '−': '-', '–': '-', '—': '-',
+    }
+
+    # Precompiled codepoint -> LaTeX table so convert_text substitutes
+    # every symbol in a single C-level pass instead of one str.replace
+    # scan per symbol; maketrans handles the char -> string mapping
+    _symbol_trans = str.maketrans(symbol_map)
+
+    # The few ASCII characters the table maps; pure-ASCII text containing
+    # none of them translates to itself and can skip the table entirely
+    _ascii_trigger = frozenset(filter(str.isascii, symbol_map))
+
     def __init__(self):
-        self.symbol_map = {
-            # Greek letters
-            'α': '\\alpha', 'β': '\\beta', 'γ': '\\gamma', 'δ': '\\delta',
-            'ε': '\\epsilon', 'ζ': '\\zeta', 'η': '\\eta', 'θ': '\\theta',
-            'ι': '\\iota', 'κ': '\\kappa', 'λ': '\\lambda', 'μ': '\\mu',
-            'ν': '\\nu', 'ξ': '\\xi', 'ο': 'o', 'π': '\\pi',
-            'ρ': '\\rho', 'σ': '\\sigma', 'τ': '\\tau', 'υ': '\\upsilon',
-            'φ': '\\phi', 'χ': '\\chi', 'ψ': '\\psi', 'ω': '\\omega',
-            
-            # Capital Greek letters
-            'Α': 'A', 'Β': 'B', 'Γ': '\\Gamma', 'Δ': '\\Delta',
-            'Ε': 'E', 'Ζ': 'Z', 'Η': 'H', 'Θ': '\\Theta',
-            'Ι': 'I', 'Κ': 'K', 'Λ': '\\Lambda', 'Μ': 'M',
-            'Ν': 'N', 'Ξ': '\\Xi', 'Ο': 'O', 'Π': '\\Pi',
-            'Ρ': 'P', 'Σ': '\\Sigma', 'Τ': 'T', 'Υ': '\\Upsilon',
-            'Φ': '\\Phi', 'Χ': 'X', 'Ψ': '\\Psi', 'Ω': '\\Omega',
-            
-            # Mathematical operators
-            '∞': '\\infty', '∑': '\\sum', '∫': '\\int', '∂': '\\partial',
-            '∇': '\\nabla', '∆': '\\Delta', '∏': '\\prod',
-            
-            # Relations
-            '≤': '\\leq', '≥': '\\geq', '≠': '\\neq', '≈': '\\approx',
-            '≡': '\\equiv', '∝': '\\propto', '∼': '\\sim',
-            
-            # Set theory
-            '∈': '\\in', '∉': '\\notin', '⊂': '\\subset', '⊆': '\\subseteq',
-            '⊃': '\\supset', '⊇': '\\supseteq', '∪': '\\cup', '∩': '\\cap',
-            '∅': '\\emptyset', '∀': '\\forall', '∃': '\\exists',
-            
-            # Arrows
-            '→': '\\rightarrow', '←': '\\leftarrow', '↔': '\\leftrightarrow',
-            '⇒': '\\Rightarrow', '⇐': '\\Leftarrow', '⇔': '\\Leftrightarrow',
-            '↑': '\\uparrow', '↓': '\\downarrow', '↕': '\\updownarrow',
-            
-            # Other symbols
-            '±': '\\pm', '∓': '\\mp', '×': '\\times', '÷': '\\div',
-            '·': '\\cdot', '∘': '\\circ', '√': '\\sqrt', '∝': '\\propto',
-            '∠': '\\angle', '⊥': '\\perp', '∥': '\\parallel',
-            '~': '\\sim',  # ASCII tilde mapped to \sim (within math)
-            # Additional mappings for calligraphic/blackboard symbols and variants used in formulas
-            'ℒ': '\\mathcal{L}',  # Script L
-            '𝒟': '\\mathcal{D}',  # Script D (uppercase)
-            'ℰ': '\\mathbb{E}',  # Blackboard bold E (alternative)
-            '𝔼': '\\mathbb{E}',  # Blackboard bold E (common)
-            'ϕ': '\\varphi',      # Variant phi
+        # O(1) dispatch on the tag local name instead of a ~20-branch
+        # if/elif chain in convert_element
+        self._dispatch = {
+            'oMath': self.convert_omath,
+            'f': self.convert_fraction,
+            'sSup': self.convert_superscript,
+            'sSub': self.convert_subscript,
+            'sSubSup': self.convert_subsuperscript,
+            'rad': self.convert_radical,
+            'nary': self.convert_nary,
+            'd': self.convert_delimiter,
+            'm': self.convert_matrix,
+            'func': self.convert_function,
+            'acc': self.convert_accent,
+            'bar': self.convert_bar,
+            'box': self.convert_box,
+            'borderBox': self.convert_border_box,
+            'groupChr': self.convert_group_char,
+            'limLow': self.convert_limit_lower,
+            'limUpp': self.convert_limit_upper,
+            'r': self.convert_run,
+            't': self.convert_text,
+            'sym': self.convert_symbol,
         }
-    
+
     def _get_attr(self, element, attr_name):
         """Helper to fetch an attribute value ignoring namespaces."""
         if attr_name in element.attrib:
@@ -73,177 +213,86 @@ class OmmlToLatexConverter:
         """Convert an OMML element to LaTeX."""
         if element is None:
             return ""
-        
-        tag = element.tag.split('}')[-1] if '}' in element.tag else element.tag
-        
-        if tag == 'oMath':
-            return self.convert_omath(element)
-        elif tag == 'f':
-            return self.convert_fraction(element)
-        elif tag == 'sSup':
-            return self.convert_superscript(element)
-        elif tag == 'sSub':
-            return self.convert_subscript(element)
-        elif tag == 'sSubSup':
-            return self.convert_subsuperscript(element)
-        elif tag == 'rad':
-            return self.convert_radical(element)
-        elif tag == 'nary':
-            return self.convert_nary(element)
-        elif tag == 'd':
-            return self.convert_delimiter(element)
-        elif tag == 'm':
-            return self.convert_matrix(element)
-        elif tag == 'func':
-            return self.convert_function(element)
-        elif tag == 'acc':
-            return self.convert_accent(element)
-        elif tag == 'bar':
-            return self.convert_bar(element)
-        elif tag == 'box':
-            return self.convert_box(element)
-        elif tag == 'borderBox':
-            return self.convert_border_box(element)
-        elif tag == 'groupChr':
-            return self.convert_group_char(element)
-        elif tag == 'limLow':
-            return self.convert_limit_lower(element)
-        elif tag == 'limUpp':
-            return self.convert_limit_upper(element)
-        elif tag == 'r':
-            return self.convert_run(element)
-        elif tag == 't':
-            return self.convert_text(element)
-        elif tag == 'sym':
-            return self.convert_symbol(element)
-        else:
-            # For unknown elements, try to process children
-            result = ""
-            for child in element:
-                result += self.convert_element(child)
-            return result
-    
+
+        # Extract the local name with a slice (rfind avoids the list that
+        # split('}') would allocate per node)
+        tag = element.tag
+        localname = tag[tag.rfind('}') + 1:]
+
+        handler = self._dispatch.get(localname)
+        if handler is not None:
+            return handler(element)
+
+        # For unknown elements, try to process children
+        convert = self.convert_element
+        parts = []
+        append = parts.append
+        for child in element:
+            append(convert(child))
+        return "".join(parts)
+
     def convert_omath(self, element):
         """Convert oMath element."""
-        result = ""
+        convert = self.convert_element
+        parts = []
+        append = parts.append
         for child in element:
-            result += self.convert_element(child)
-        return result
+            append(convert(child))
+        return "".join(parts)
     
     def convert_fraction(self, element):
         """Convert fraction element."""
-        num = ""
-        den = ""
-        
-        for child in element:
-            tag = child.tag.split('}')[-1] if '}' in child.tag else child.tag
-            if tag == 'num':
-                num = self.convert_element(child)
-            elif tag == 'den':
-                den = self.convert_element(child)
-        
+        num = self.convert_element(element.find(M_NUM))
+        den = self.convert_element(element.find(M_DEN))
         return f"\\frac{{{num}}}{{{den}}}"
-    
+
     def convert_superscript(self, element):
         """Convert superscript element."""
-        base = ""
-        sup = ""
-        
-        for child in element:
-            tag = child.tag.split('}')[-1] if '}' in child.tag else child.tag
-            if tag == 'e':
-                base = self.convert_element(child)
-            elif tag == 'sup':
-                sup = self.convert_element(child)
-        
+        base = self.convert_element(element.find(M_E))
+        sup = self.convert_element(element.find(M_SUP))
         return f"{{{base}}}^{{{sup}}}"
-    
+
     def convert_subscript(self, element):
         """Convert subscript element."""
-        base = ""
-        sub = ""
-        
-        for child in element:
-            tag = child.tag.split('}')[-1] if '}' in child.tag else child.tag
-            if tag == 'e':
-                base = self.convert_element(child)
-            elif tag == 'sub':
-                sub = self.convert_element(child)
-        
+        base = self.convert_element(element.find(M_E))
+        sub = self.convert_element(element.find(M_SUB))
+
         # Special-case expectation operator E to \mathbb{E}
         if base.strip('{}') == 'E':
             base = '\\mathbb{E}'
         return f"{{{base}}}_{{{sub}}}"
-    
+
     def convert_subsuperscript(self, element):
         """Convert subscript and superscript element."""
-        base = ""
-        sub = ""
-        sup = ""
-        
-        for child in element:
-            tag = child.tag.split('}')[-1] if '}' in child.tag else child.tag
-            if tag == 'e':
-                base = self.convert_element(child)
-            elif tag == 'sub':
-                sub = self.convert_element(child)
-            elif tag == 'sup':
-                sup = self.convert_element(child)
-        
+        base = self.convert_element(element.find(M_E))
+        sub = self.convert_element(element.find(M_SUB))
+        sup = self.convert_element(element.find(M_SUP))
         return f"{{{base}}}_{{{sub}}}^{{{sup}}}"
-    
+
     def convert_radical(self, element):
         """Convert radical (square root) element."""
-        deg = ""
-        base = ""
-        
-        for child in element:
-            tag = child.tag.split('}')[-1] if '}' in child.tag else child.tag
-            if tag == 'deg':
-                deg = self.convert_element(child)
-            elif tag == 'e':
-                base = self.convert_element(child)
-        
+        deg = self.convert_element(element.find(M_DEG))
+        base = self.convert_element(element.find(M_E))
+
         if deg:
             return f"\\sqrt[{deg}]{{{base}}}"
         else:
             return f"\\sqrt{{{base}}}"
-    
+
     def convert_nary(self, element):
         """Convert n-ary operators (sum, integral, etc.)."""
         char = ""
-        sub = ""
-        sup = ""
-        base = ""
-        
-        for child in element:
-            tag = child.tag.split('}')[-1] if '}' in child.tag else child.tag
-            if tag == 'naryPr':
-                for prop_child in child:
-                    prop_tag = prop_child.tag.split('}')[-1] if '}' in prop_child.tag else prop_child.tag
-                    if prop_tag == 'chr':
-                        char = self._get_attr(prop_child, 'val') or ''
-            elif tag == 'sub':
-                sub = self.convert_element(child)
-            elif tag == 'sup':
-                sup = self.convert_element(child)
-            elif tag == 'e':
-                base = self.convert_element(child)
-        
-        # Map common n-ary operators
-        operator_map = {
-            '∑': '\\sum',
-            '∫': '\\int',
-            '∏': '\\prod',
-            '⋃': '\\bigcup',
-            '⋂': '\\bigcap',
-            '⋁': '\\bigvee',
-            '⋀': '\\bigwedge',
-            'max': '\\operatorname*{max}',
-            'min': '\\operatorname*{min}',
-        }
-        
-        latex_op = operator_map.get(char, char)
+        nary_pr = element.find(M_NARYPR)
+        if nary_pr is not None:
+            chr_el = nary_pr.find(M_CHR)
+            if chr_el is not None:
+                char = self._get_attr(chr_el, 'val') or ''
+
+        sub = self.convert_element(element.find(M_SUB))
+        sup = self.convert_element(element.find(M_SUP))
+        base = self.convert_element(element.find(M_E))
+
+        latex_op = _NARY_OP_MAP.get(char, char)
         
         if sub and sup:
             return f"{latex_op}_{{{sub}}}^{{{sup}}} {base}"
@@ -260,7 +309,7 @@ class OmmlToLatexConverter:
         has_bar = False
         
         for child in element.iter():
-            tag = child.tag.split('}')[-1] if '}' in child.tag else child.tag
+            tag = _localname(child.tag)
             if tag == 't' and child.text == '|':
                 has_bar = True
             elif tag in ['oMath', 'r', 't']:
@@ -301,44 +350,33 @@ class OmmlToLatexConverter:
         right_delim = ')'
 
         # First, inspect properties for custom delimiters
-        for child in element:
-            tag = child.tag.split('}')[-1] if '}' in child.tag else child.tag
-            if tag == 'dPr':
-                for pr in child:
-                    pr_tag = pr.tag.split('}')[-1] if '}' in pr.tag else pr.tag
-                    if pr_tag == 'begChr':
-                        left_delim = self._get_attr(pr, 'val') or left_delim
-                    elif pr_tag == 'endChr':
-                        right_delim = self._get_attr(pr, 'val') or right_delim
-
-        # Check if there's a separator character (e.g., "|") between expressions
         sep_char = None
-        for child in element:
-            tag = child.tag.split('}')[-1] if '}' in child.tag else child.tag
-            if tag == 'dPr':
-                # sepChr may be an attribute of <m:dPr> *or* nested <m:sepChr> element
-                sep_char = self._get_attr(child, 'sepChr') or sep_char
-                for pr in child:
-                    pr_tag = pr.tag.split('}')[-1] if '}' in pr.tag else pr.tag
-                    if pr_tag == 'sepChr':
-                        sep_char = self._get_attr(pr, 'val') or sep_char
-                    elif pr_tag == 'val' and '|' in (self._get_attr(pr, 'val') or ''):
-                        sep_char = '|'
+        for child in element.iterchildren(M_DPR):
+            # sepChr may be an attribute of <m:dPr> *or* nested <m:sepChr> element
+            sep_char = self._get_attr(child, 'sepChr') or sep_char
+            for pr in child.iterchildren():
+                pr_tag = _localname(pr.tag)
+                if pr_tag == 'begChr':
+                    left_delim = self._get_attr(pr, 'val') or left_delim
+                elif pr_tag == 'endChr':
+                    right_delim = self._get_attr(pr, 'val') or right_delim
+                elif pr_tag == 'sepChr':
+                    sep_char = self._get_attr(pr, 'val') or sep_char
+                elif pr_tag == 'val' and '|' in (self._get_attr(pr, 'val') or ''):
+                    sep_char = '|'
 
         # Collect the expressions inside the delimiter
         expr_parts = []
-        for child in element:
-            tag = child.tag.split('}')[-1] if '}' in child.tag else child.tag
-            if tag == 'e':
-                expr = self.convert_element(child)
-                # Check if this expression contains a vertical bar that should be treated as a separator
-                if '|' in expr and not sep_char:
-                    parts = expr.split('|')
-                    if len(parts) == 2:  # Only split if there's exactly one vertical bar
-                        expr_parts.extend(parts)
-                        sep_char = '|'
-                        continue
-                expr_parts.append(expr)
+        for child in element.iterchildren(M_E):
+            expr = self.convert_element(child)
+            # Check if this expression contains a vertical bar that should be treated as a separator
+            if '|' in expr and not sep_char:
+                parts = expr.split('|')
+                if len(parts) == 2:  # Only split if there's exactly one vertical bar
+                    expr_parts.extend(parts)
+                    sep_char = '|'
+                    continue
+            expr_parts.append(expr)
 
         # Forced special handling for p_θ(y|x,I) patterns - this is a common case in ML papers
         # Check if we have exactly 2 expressions and no explicit separator
@@ -398,182 +436,127 @@ class OmmlToLatexConverter:
     def convert_matrix(self, element):
         """Convert matrix element."""
         # This is a simplified implementation
-        result = "\\begin{matrix}\n"
-        for child in element:
-            tag = child.tag.split('}')[-1] if '}' in child.tag else child.tag
-            if tag == 'mr':  # matrix row
-                row_content = []
-                for cell in child:
-                    cell_content = self.convert_element(cell)
-                    row_content.append(cell_content)
-                result += " & ".join(row_content) + " \\\\\n"
-        result += "\\end{matrix}"
-        return result
+        convert = self.convert_element
+        rows_out = []
+        for row in element.iterchildren(M_MR):
+            rows_out.append(" & ".join(convert(cell) for cell in row) + " \\\\\n")
+        return "\\begin{matrix}\n" + "".join(rows_out) + "\\end{matrix}"
     
     def convert_function(self, element):
         """Convert function element."""
-        func_name = ""
-        base = ""
-        
-        for child in element:
-            tag = child.tag.split('}')[-1] if '}' in child.tag else child.tag
-            if tag == 'fName':
-                func_name = self.convert_element(child)
-            elif tag == 'e':
-                base = self.convert_element(child)
-        
+        func_name = self.convert_element(element.find(M_FNAME))
+        base = self.convert_element(element.find(M_E))
         return f"\\{func_name}{{{base}}}"
-    
+
     def convert_accent(self, element):
         """Convert accent element."""
         # Simplified implementation
-        base = ""
-        for child in element:
-            tag = child.tag.split('}')[-1] if '}' in child.tag else child.tag
-            if tag == 'e':
-                base = self.convert_element(child)
+        base = self.convert_element(element.find(M_E))
         return f"\\hat{{{base}}}"
-    
+
     def convert_bar(self, element):
         """Convert bar element."""
-        base = ""
-        for child in element:
-            tag = child.tag.split('}')[-1] if '}' in child.tag else child.tag
-            if tag == 'e':
-                base = self.convert_element(child)
+        base = self.convert_element(element.find(M_E))
         return f"\\overline{{{base}}}"
     
     def convert_box(self, element):
         """Convert box element."""
-        return self.convert_element(element)
+        convert = self.convert_element
+        parts = []
+        append = parts.append
+        for child in element:
+            append(convert(child))
+        return "".join(parts)
     
     def convert_border_box(self, element):
         """Convert border box element."""
-        base = ""
-        for child in element:
-            tag = child.tag.split('}')[-1] if '}' in child.tag else child.tag
-            if tag == 'e':
-                base = self.convert_element(child)
+        base = self.convert_element(element.find(M_E))
         return f"\\boxed{{{base}}}"
-    
+
     def convert_group_char(self, element):
         """Convert group character element."""
         # Simplified implementation
-        base = ""
-        for child in element:
-            tag = child.tag.split('}')[-1] if '}' in child.tag else child.tag
-            if tag == 'e':
-                base = self.convert_element(child)
+        base = self.convert_element(element.find(M_E))
         return f"\\underbrace{{{base}}}"
-    
+
     def convert_limit_lower(self, element):
         """Convert limit lower element."""
-        base = ""
-        lim = ""
-        
-        for child in element:
-            tag = child.tag.split('}')[-1] if '}' in child.tag else child.tag
-            if tag == 'e':
-                base = self.convert_element(child)
-            elif tag == 'lim':
-                lim = self.convert_element(child)
-        
+        base = self.convert_element(element.find(M_E))
+        lim = self.convert_element(element.find(M_LIM))
+
         # Detect common operators like max/min to use operatorname* with subscript
         base_stripped = base.strip('{}')
         if base_stripped in {'max', 'min'} and lim:
             # Remove any extra backslashes before operatorname
-            base_stripped = re.sub(r'\\+', '', base_stripped)
+            base_stripped = _BACKSLASH_RUN_RE.sub('', base_stripped)
             return f"\\operatorname*{{{base_stripped}}}_{{{lim}}}"
         else:
             return f"\\underset{{{lim}}}{{{base}}}"
-    
+
     def convert_limit_upper(self, element):
         """Convert limit upper element."""
-        base = ""
-        lim = ""
-        
-        for child in element:
-            tag = child.tag.split('}')[-1] if '}' in child.tag else child.tag
-            if tag == 'e':
-                base = self.convert_element(child)
-            elif tag == 'lim':
-                lim = self.convert_element(child)
-        
+        base = self.convert_element(element.find(M_E))
+        lim = self.convert_element(element.find(M_LIM))
         return f"\\overset{{{lim}}}{{{base}}}"
     
     def convert_run(self, element):
         """Convert run element."""
-        result = ""
+        convert = self.convert_element
+        parts = []
+        append = parts.append
         for child in element:
-            result += self.convert_element(child)
-        return result
+            # Run properties (m:rPr / w:rPr) carry formatting, not content;
+            # walking them only produces discarded conversions
+            if _localname(child.tag) == 'rPr':
+                continue
+            append(convert(child))
+        return "".join(parts)
     
     def convert_text(self, element):
         """Convert text element."""
         text = element.text or ""
+        if not text:
+            return ""
 
         # Special handling for vertical bar in math mode
         if text == '|':
             return '\\mid'
 
-        # Replace symbols with LaTeX equivalents first
-        for symbol, latex in self.symbol_map.items():
-            text = text.replace(symbol, latex)
+        # Most runs in real documents are plain ASCII identifiers and digits;
+        # those translate to themselves, so return them without the table pass
+        if text.isascii() and self._ascii_trigger.isdisjoint(text):
+            return text
 
-        # Don't escape special characters in math mode as they might be part of LaTeX commands
-        # Just remove problematic equation numbering patterns
-        import re
+        return self._transform_text(text)
 
-        # Remove equation numbers like #(2-1), #(3-4), etc.
-        text = re.sub(r'#\([^)]+\)', '', text)
+    @functools.lru_cache(maxsize=4096)
+    def _transform_text(self, text):
+        """Translate symbols in a raw text run, memoized per input string.
 
-        # Remove standalone # that aren't part of LaTeX commands
-        text = re.sub(r'(?<!\\)#(?![a-zA-Z])', '', text)
-
-        return text
+        Real documents repeat the same short runs constantly (variable names,
+        operators, digits), so most calls are cache hits.  Equation numbering
+        like #(2-1) is stripped once over the assembled formula in
+        clean_latex_output rather than per text node -- the end-of-pipeline
+        pass also catches numbers that span node boundaries.  Special
+        characters are not escaped in math mode as they might be part of
+        LaTeX commands.
+        """
+        return text.translate(self._symbol_trans)
 
     def add_spaces_after_latex_commands(self, text):
         """Add spaces after LaTeX commands for proper formatting."""
-        import re
-
-        # List of LaTeX commands that should have spaces after them
-        # Note: The short command \\in is deliberately excluded to avoid interfering
-        # with longer commands like \\infty or \\int. If needed, callers should
-        # insert explicit spaces around \\in themselves.
-        latex_commands = [
-            r'\\rightarrow', r'\\leftarrow', r'\\leftrightarrow', r'\\Rightarrow',
-            r'\\Leftarrow', r'\\Leftrightarrow', r'\\uparrow', r'\\downarrow', r'\\updownarrow',
-            r'\\subseteq', r'\\supseteq', r'\\subset', r'\\supset',
-            r'\\notin', r'\\neq', r'\\approx', r'\\equiv', r'\\propto',
-            r'\\parallel', r'\\emptyset', r'\\forall', r'\\exists',
-            r'\\geq', r'\\leq', r'\\pm', r'\\mp', r'\\times', r'\\div',
-            r'\\cdot', r'\\circ', r'\\sqrt', r'\\angle', r'\\perp',
-            r'\\infty', r'\\partial', r'\\nabla',
-            # Greek letters and variants
-            r'\\Gamma', r'\\Delta', r'\\Theta', r'\\Lambda', r'\\Xi', r'\\Pi',
-            r'\\Sigma', r'\\Upsilon', r'\\Phi', r'\\Psi', r'\\Omega',
-            r'\\alpha', r'\\beta', r'\\gamma', r'\\delta', r'\\epsilon', r'\\zeta',
-            r'\\eta', r'\\theta', r'\\iota', r'\\kappa', r'\\lambda', r'\\mu',
-            r'\\nu', r'\\xi', r'\\pi', r'\\rho', r'\\sigma', r'\\tau',
-            r'\\upsilon', r'\\phi', r'\\chi', r'\\psi', r'\\omega',
-            r'\\cup', r'\\cap', r'\\sim'
-        ]
-
-        # Process longer commands first to reduce partial-match issues
-        latex_commands.sort(key=len, reverse=True)
+        # No backslash means no LaTeX commands to space; skip the scans
+        if '\\' not in text:
+            return text
 
         # Add space after LaTeX commands if they are immediately followed by
-        # an alphanumeric character *and* the command itself is not a prefix
-        # of a longer command (handled above via ordering and exclusion).
-        for cmd in latex_commands:
-            pattern = f'({cmd})(?=[a-zA-Z0-9])'
-            text = re.sub(pattern, r'\1 ', text)
-
-        # Special-case: ensure a space after membership operator "\\in" when followed by
-        # an uppercase identifier (e.g. "\\inD" -> "\\in D").  This will *not* match
-        # when the next letters form longer commands like "\\infty" or "\\int" because
-        # they start with lowercase letters.
-        text = re.sub(r'\\in([A-Z])', r'\\in \1', text)
+        # an alphanumeric character; the single precompiled alternation scans
+        # the text once instead of once per command
+        text = _LATEX_CMD_RE.sub(r'\1 ', text)
+
+        # Special-case: ensure a space after membership operator "\\in" when
+        # followed by an uppercase identifier (e.g. "\\inD" -> "\\in D")
+        text = _IN_UPPER_RE.sub(r'\\in \1', text)
 
         return text
     
@@ -582,25 +565,19 @@ class OmmlToLatexConverter:
         if not latex_text:
             return latex_text
 
-        import re
-
-        # Remove equation numbers and references that cause issues
-        # Pattern like #(2-1), #(3-4), #\left( 2−1 \right), etc.
-        latex_text = re.sub(r'#\([^)]+\)', '', latex_text)
-        latex_text = re.sub(r'#\\left\([^)]+\\right\)', '', latex_text)
-
-        # Remove standalone # characters that aren't part of LaTeX commands
-        latex_text = re.sub(r'(?<!\\)#(?![a-zA-Z])', '', latex_text)
+        # Remove equation numbers like #(2-1) / #\left( 2−1 \right) and
+        # standalone # characters that aren't part of LaTeX commands
+        latex_text = _HASH_STRIP_RE.sub('', latex_text)
 
         # Fix double backslashes in LaTeX commands (except for line breaks)
-        latex_text = re.sub(r'\\\\(?!\\|$)', r'\\', latex_text)
+        latex_text = _DOUBLE_BACKSLASH_RE.sub(r'\\', latex_text)
 
         # Add proper spacing after LaTeX commands
         latex_text = self.add_spaces_after_latex_commands(latex_text)
 
         # Clean up extra spaces and commas at the end
-        latex_text = re.sub(r'\s*,\s*$', '', latex_text)
-        latex_text = re.sub(r'\s+', ' ', latex_text).strip()
+        latex_text = _TRAILING_COMMA_RE.sub('', latex_text)
+        latex_text = _WS_RE.sub(' ', latex_text).strip()
 
         return latex_text
 
@@ -609,8 +586,8 @@ class OmmlToLatexConverter:
         try:
             result = self.convert_element(omml_element)
             return self.clean_latex_output(result)
-        except Exception as e:
-            print(f"Error converting OMML to LaTeX: {e}")
+        except (AttributeError, KeyError, etree.LxmlError, RecursionError) as e:
+            logger.warning("Error converting OMML to LaTeX: %s", e)
             return "[Math Formula]"
 
     def convert_symbol(self, element):
@@ -622,7 +599,23 @@ class OmmlToLatexConverter:
         return self.symbol_map.get(char_val, char_val)
 
 
+# Shared converter instance; building the symbol tables and dispatch map once
+# is enough, and conversion itself keeps no per-document state
+_SHARED_CONVERTER = OmmlToLatexConverter()
+
+
+@functools.lru_cache(maxsize=4096)
+def _convert_cached(omml_bytes):
+    """Convert a serialized oMath subtree, memoizing repeated formulas."""
+    return _SHARED_CONVERTER.omml_to_latex(etree.fromstring(omml_bytes))
+
+
 def convert_omml_to_latex(omml_element):
     """Convenience function to convert OMML to LaTeX."""
-    converter = OmmlToLatexConverter()
-    return converter.omml_to_latex(omml_element)
+    # Documents often repeat the same formula (referenced equations, recurring
+    # inline symbols); keying a cache on the serialized subtree turns those
+    # repeats into a dict hit instead of a fresh tree walk.  with_tail=False
+    # keeps the element's tail text out of the key: it is not part of the
+    # formula, would fragment the cache, and makes the bytes unparseable
+    # when the tail is non-whitespace
+    return _convert_cached(etree.tostring(omml_element, with_tail=False))